@@ -1 +0,0 @@
-env_configs = []
\ No newline at end of file
@@ -1,33 +1,90 @@
+from __future__ import annotations
 import logging
-from decimal import Decimal
+import os
+from typing import Callable, TypeVar
 from .exceptions import AlreadyConfiguredException, ConfigurationValidationFailedException, IncorrectConfigTypeException, ConfigurationNotFoundException, PrematureConfigurationRetrievalException
 from .env_configs import env_configs
 from .issues import EnvIssue
+from .types import EnvConfig, ResolvedEnv, ConfiguredEnv, _DecimalType, _ResolvedType, _coercer
+
+# Resolved envs are stored as (env_type, value, raw, config) so a typed read is a single dict get and tuple unpack.
+resolved_envs: dict[str, tuple[type, _ResolvedType, str, EnvConfig]] = {}
+prod_validation: list[ResolvedEnv] = []
+
+# Built on the first get_configuration() call after validation and reused until validate_env() runs again.
+_configuration_cache: list[ConfiguredEnv] | None = None
 
 validated = False
 
+_MASK = '***'
+
+# Decimal is left out of these tables so the decimal module is only imported when a caller asks for a decimal.
+_TYPE_LABELS: dict[type, str] = {str: 'a string', bool: 'a boolean', int: 'an integer', float: 'a float'}
+
+_TYPE_NAMES: dict[type, str] = {str: 'str', bool: 'bool', int: 'int', float: 'float'}
+
+# Resolved on the first get_config_decimal() call and reused afterwards.
+_Decimal: type[_DecimalType] | None = None
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar('_T')
+
 
-def validate_env():
+def validate_env(max_issues: int | None = None):
     """
     Validates the environment configuration. This function must be called before getting any configuration values.
 
+    :param max_issues: Stop validating once this many issues have been found. Defaults to None, which reports every issue.
+    :raise ValueError: If max_issues is less than 1.
     :raise AlreadyConfiguredException: If the environment configuration is already configured.
     :raise Exception: If there was an attempt to get the system configuration before the env configs were validated.
     """
     global validated
+    global _configuration_cache
+
+    if max_issues is not None and max_issues < 1:
+        raise ValueError(f'max_issues must be at least 1, got {max_issues}.')
 
     if validated:
         raise AlreadyConfiguredException()
 
+    _configuration_cache = None
+
     issues:list[EnvIssue] = []
+    resolved_envs.clear()
+    prod_validation.clear()
 
     for config in env_configs:
-        issues.extend(config.issues)
+        config._validate(os.environ)
+        if config.issues:
+            issues.extend(config.issues)
+            if max_issues is not None and len(issues) >= max_issues:
+                del issues[max_issues:]
+                break
+            continue
+        if issues:
+            continue
+
+        resolved_envs[config.name] = (config.env_type, config.resolved_value, config.raw_value, config)
+        if config.prod_critical:
+            prod_validation.append(config.get_resolved())
+
     if len(issues) > 0:
+        resolved_envs.clear()
+        prod_validation.clear()
         raise ConfigurationValidationFailedException(issues)
 
+    for prod_env in prod_validation:
+        cfg = prod_env.config
+        # Compare parsed values so any accepted spelling of the expected value (e.g. 'true' for a bool) matches.
+        coerce = _coercer(cfg.env_type)
+        try:
+            matches = coerce(cfg.prod_value) == prod_env.value
+        except (ValueError, ArithmeticError):
+            matches = False
+        if not matches:
+            logger.warning('Production critical env %s is not set to the expected value.', cfg.name)
     validated = True
 
 
@@ -39,9 +96,15 @@ def get_config(name: str) -> str:
     :param name: The name of the config.
     :return: The raw value of the config.
     """
-    _basic_config_checks(name)
+    if not validated:
+        raise PrematureConfigurationRetrievalException('There was an attempt to get a config before the env configs were validated.')
+
+    try:
+        _, _, raw, _ = resolved_envs[name]
+    except KeyError:
+        raise ConfigurationNotFoundException(f'The env config {name} does not exist.') from None
 
-    return resolved_envs[name].raw
+    return raw
 
 
 def get_config_str(name: str) -> str:
@@ -51,12 +114,7 @@ def get_config_str(name: str) -> str:
     :param name: The name of the config.
     :return: The value of the config.
     """
-    _basic_config_checks(name)
-
-    if resolved_envs[name].config.env_type != str:
-        raise IncorrectConfigTypeException(f'The env config {name} is not a string.')
-
-    return resolved_envs[name].value
+    return _get_typed(name, str)
 
 
 def get_config_bool(name: str) -> bool:
@@ -66,12 +124,7 @@ def get_config_bool(name: str) -> bool:
     :param name: The name of the config.
     :return: The value of the config.
     """
-    _basic_config_checks(name)
-
-    if resolved_envs[name].config.env_type != bool:
-        raise IncorrectConfigTypeException(f'The env config {name} is not a boolean.')
-
-    return resolved_envs[name].value
+    return _get_typed(name, bool)
 
 
 def get_config_int(name: str) -> int:
@@ -81,12 +134,7 @@ def get_config_int(name: str) -> int:
     :param name: The name of the config.
     :return: The value of the config.
     """
-    _basic_config_checks(name)
-
-    if resolved_envs[name].config.env_type != int:
-        raise IncorrectConfigTypeException(f'The env config {name} is not an integer.')
-
-    return resolved_envs[name].value
+    return _get_typed(name, int)
 
 
 def get_config_float(name: str) -> float:
@@ -96,65 +144,152 @@ def get_config_float(name: str) -> float:
     :param name: The name of the config.
     :return: The value of the config.
     """
-    _basic_config_checks(name)
+    return _get_typed(name, float)
 
-    if resolved_envs[name].config.env_type != float:
-        raise IncorrectConfigTypeException(f'The env config {name} is not a float.')
-    return resolved_envs[name].value
 
-
-def get_config_decimal(name: str) -> Decimal:
+def get_config_decimal(name: str) -> _DecimalType:
     """
     Get a decimal config value. Validations must be run before this function is called.
 
     :param name: The name of the config.
     :return: The value of the config.
     """
-    _basic_config_checks(name)
-
-    if resolved_envs[name].config.env_type != Decimal:
-        raise IncorrectConfigTypeException(f'The env config {name} is not a decimal.')
+    global _Decimal
 
-    return resolved_envs[name].value
+    if _Decimal is None:
+        from decimal import Decimal
+        _Decimal = Decimal
 
+    return _get_typed(name, _Decimal)
 
-def _basic_config_checks(name: str):
-    global validated
 
+def _get_typed(name: str, expected_type: type[_T]) -> _T:
     if not validated:
         raise PrematureConfigurationRetrievalException('There was an attempt to get a config before the env configs were validated.')
 
-    if name not in resolved_envs:
-        raise ConfigurationNotFoundException(f'The env config {name} does not exist.')
+    try:
+        env_type, value, _, _ = resolved_envs[name]
+    except KeyError:
+        raise ConfigurationNotFoundException(f'The env config {name} does not exist.') from None
+
+    if env_type is not expected_type:
+        label = _TYPE_LABELS.get(expected_type) or f'a {expected_type.__name__.lower()}'
+        raise IncorrectConfigTypeException(f'The env config {name} is not {label}.')
+
+    return value
+
+
+def bind_config(name: str) -> Callable[[], str]:
+    """
+    Bind a raw config value to an accessor. Validations must be run before this function is called. The config is looked up
+    once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the raw value of the config.
+    """
+    value = get_config(name)
 
+    return lambda: value
 
-def get_configuration() -> list:
+
+def bind_config_str(name: str) -> Callable[[], str]:
     """
-    Get a list of the current configurations.
+    Bind a string config value to an accessor. Validations must be run before this function is called. The config is looked up and
+    type checked once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the value of the config.
+    """
+    value = get_config_str(name)
+
+    return lambda: value
+
+
+def bind_config_bool(name: str) -> Callable[[], bool]:
+    """
+    Bind a boolean config value to an accessor. Validations must be run before this function is called. The config is looked up and
+    type checked once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the value of the config.
+    """
+    value = get_config_bool(name)
+
+    return lambda: value
+
+
+def bind_config_int(name: str) -> Callable[[], int]:
+    """
+    Bind an integer config value to an accessor. Validations must be run before this function is called. The config is looked up and
+    type checked once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the value of the config.
+    """
+    value = get_config_int(name)
+
+    return lambda: value
+
+
+def bind_config_float(name: str) -> Callable[[], float]:
+    """
+    Bind a float config value to an accessor. Validations must be run before this function is called. The config is looked up and
+    type checked once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the value of the config.
+    """
+    value = get_config_float(name)
+
+    return lambda: value
+
+
+def bind_config_decimal(name: str) -> Callable[[], _DecimalType]:
+    """
+    Bind a decimal config value to an accessor. Validations must be run before this function is called. The config is looked up and
+    type checked once, so hot paths that read the same config repeatedly can call the accessor instead.
+
+    :param name: The name of the config.
+    :return: A function returning the value of the config.
+    """
+    value = get_config_decimal(name)
+
+    return lambda: value
+
+
+def get_configuration() -> list[ConfiguredEnv]:
+    """
+    Get a list of the current configurations. The list is built once per validation and shared between calls, so it
+    must not be modified.
 
     :return: The configuration list.
     """
+    global _configuration_cache
+
     if not validated:
         raise PrematureConfigurationRetrievalException('There was an attempt to get the system configuration before the env configs were validated.')
 
-    result = []
-    for config in resolved_envs:
-        secure = resolved_envs[config].config.secure
+    if _configuration_cache is not None:
+        return _configuration_cache
+
+    result: list[ConfiguredEnv] = []
+    for name, (env_type, resolved_value, resolved_raw, cfg) in resolved_envs.items():
+        secure = cfg.secure
+        if secure:
+            default = prod_value = value = raw = _MASK
+        else:
+            default, prod_value, value, raw = cfg.default, cfg.prod_value, resolved_value, resolved_raw
         result.append(ConfiguredEnv(
-            name=config,
-            description=resolved_envs[config].config.description,
-            env_type=str(resolved_envs[config].config.env_type),
-            default=mask_secure(resolved_envs[config].config.default, secure),
-            secure=resolved_envs[config].config.secure,
-            prod_critical=resolved_envs[config].config.prod_critical,
-            prod_value=mask_secure(resolved_envs[config].config.prod_value, secure),
-            value=mask_secure(resolved_envs[config].value, secure),
-            raw=mask_secure(resolved_envs[config].raw, secure)
+            name=name,
+            description=cfg.description,
+            env_type=_TYPE_NAMES.get(env_type) or env_type.__name__,
+            default=default,
+            secure=secure,
+            prod_critical=cfg.prod_critical,
+            prod_value=prod_value,
+            value=value,
+            raw=raw
         ))
-    return result
-
 
-def mask_secure(value, secure: bool):
-    if secure:
-        return '***'
-    return value
+    _configuration_cache = result
+    return result
@@ -8,9 +8,14 @@ class AlreadyConfiguredException(Exception):
 class ConfigurationValidationFailedException(Exception):
 
     def __init__(self, issues: list[EnvIssue]):
-        issue_str = '\n\nThere is an issue with the env configuration:\n\n' + '\n'.join(
-            [str(issue) for issue in issues])
-        super().__init__(issue_str)
+        super().__init__(issues)
+        self.issues = issues
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = '\n\nThere is an issue with the env configuration:\n\n' + '\n'.join(map(str, self.issues))
+        return self._message
 
 class IncorrectConfigTypeException(Exception):
 
@@ -1,8 +1,6 @@
-from dataclasses import dataclass
-from typing import override
+from typing import NamedTuple, override
 
-@dataclass
-class EnvIssue:
+class EnvIssue(NamedTuple):
     """
     Represents an issue related to an environment variable.
 
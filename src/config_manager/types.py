@@ -1,15 +1,84 @@
-from dataclasses import dataclass, field
-from decimal import Decimal
+from __future__ import annotations
+from dataclasses import InitVar, dataclass, field
+from typing import TYPE_CHECKING, Callable, Mapping, TypedDict
 import os
+import sys
 from .issues import EnvIssue
 from .exceptions import ConfigurationValidationFailedException
 import logging
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+
 logger = logging.getLogger(__name__)
 
-ResolvedType = str | bool | float | int | Decimal
+# These aliases are evaluated lazily, so typing.get_type_hints() can resolve annotations that use them without the
+# decimal module being imported. Only reading an alias's __value__ needs Decimal.
+type _DecimalType = Decimal
+type _ResolvedType = str | bool | float | int | Decimal
+type _EnvType = type[str | bool | int | float | Decimal]
+
+
+def __getattr__(name: str):
+    # ResolvedType stays a real union usable with isinstance(); it is built on first access so importing this module
+    # does not import decimal.
+    if name == 'ResolvedType':
+        from decimal import Decimal
+
+        resolved_type = globals()['ResolvedType'] = str | bool | float | int | Decimal
+        return resolved_type
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+_TRUE_SET: frozenset[str] = frozenset({'true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'})
+_FALSE_SET: frozenset[str] = frozenset({'false', 'False', 'FALSE', '0', 'no', 'No', 'NO', 'off', 'Off', 'OFF'})
+
+
+def _parse_bool(value: str) -> bool:
+    if value in _TRUE_SET:
+        return True
+    if value in _FALSE_SET:
+        return False
+    # Only unusual spellings pay for normalising the string.
+    normalized = value.strip().lower()
+    if normalized in _TRUE_SET:
+        return True
+    if normalized in _FALSE_SET:
+        return False
+    raise ValueError(f'Invalid boolean value: {value}')
+
+
+_COERCE: dict[type, Callable[[str], _ResolvedType]] = {
+    str: str,
+    bool: _parse_bool,
+    int: int,
+    float: float,
+}
 
-@dataclass
+
+def _coercer(env_type: type) -> Callable[[str], _ResolvedType] | None:
+    coerce = _COERCE.get(env_type)
+    if coerce is None:
+        # Decimal is registered on first use so the decimal module is never imported on our behalf. A config
+        # declared with env_type=Decimal means the caller has already imported it.
+        decimal = sys.modules.get('decimal')
+        if decimal is not None and env_type is decimal.Decimal:
+            coerce = _COERCE[env_type] = decimal.Decimal
+    return coerce
+
+@dataclass(slots=True, frozen=True)
+class ResolvedEnv:
+    """
+    Represents a resolved environment variable.
+
+    :param config: Configuration rules for parsing
+    :param value: Type-converted value
+    :param raw: Original environment string
+    """
+    config: EnvConfig
+    value: _ResolvedType
+    raw: str
+
+@dataclass(slots=True, eq=False)
 class EnvConfig:
     """
     Represents the configuration for an environment variable.
@@ -21,26 +90,30 @@ class EnvConfig:
     :param secure: Whether the environment variable contains sensitive information. Defaults to True.
     :param prod_critical: Indicates if the environment variable is critical in production. If set to True, the environment variable will be validated to have the correct type and value in production. Defaults to False.
     :param prod_value: The expected value of the environment variable in production. Defaults to None.
+    :param register: Whether to register the config so it is validated by validate_env. Defaults to True.
     """
     name: str
     description: str
-    env_type: type[str | bool | int | float | Decimal]
-    default: str | None
-    prod_value: str | None
+    env_type: _EnvType
+    default: str | None = None
+    prod_value: str | None = None
     secure: bool | None = True
     prod_critical: bool | None = False
+    register: InitVar[bool] = True
     issues: list[EnvIssue] = field(init=False)
-    resolved_value: ResolvedType | None = field(init=False, default=None)
+    resolved_value: _ResolvedType | None = field(init=False, default=None)
     raw_value: str | None = field(init=False, default=None)
     valid:bool = field(init=False, default=False)
     
-    def __post_init__(self):
-        from .env_configs import env_configs
-
+    def __post_init__(self, register: bool):
+        # Interned names let lookups keyed by string literals hit the identity fast path.
+        self.name = sys.intern(self.name)
         self.issues = []
-        self._validate()
 
-        env_configs.append(self)
+        if register:
+            from .env_configs import env_configs
+
+            env_configs.append(self)
 
     def get_resolved(self) -> ResolvedEnv:
         """
@@ -51,13 +124,18 @@ class EnvConfig:
         if self.valid is False or self.resolved_value is None or self.raw_value is None:
             raise ConfigurationValidationFailedException(issues=self.issues)
         return ResolvedEnv(
-            name=self.name,
+            config=self,
             value=self.resolved_value,
             raw=self.raw_value
         )
         
 
-    def _validate(self):
+    def _validate(self, environ: Mapping[str, str]):
+        self.issues = []
+        self.resolved_value = None
+        self.raw_value = None
+        self.valid = False
+
         if self.prod_critical and self.prod_value is None:
             self.issues.append(EnvIssue(
                 env=self.name,
@@ -65,14 +143,16 @@ class EnvConfig:
             ))
             return
 
-        if self.env_type not in [str, bool, int, float, Decimal]:
+        # Looked up on each pass so an env_type changed before validation is honoured.
+        coerce = _coercer(self.env_type)
+        if coerce is None:
             self.issues.append(EnvIssue(
                 env=self.name,
                 description="Invalid 'env_type' configuration."
             ))
             return
 
-        env_value_raw:str | None = os.environ.get(self.name, None)
+        env_value_raw:str | None = environ.get(self.name, None)
 
         env_value:str = ''
         if env_value_raw is None and self.default is not None:
@@ -87,34 +167,45 @@ class EnvConfig:
             return
 
         try:
-            if self.env_type == bool:
-                self.resolved_value = env_value.lower() == 'true'
-                if self.resolved_value:
-                    env_value = 'TRUE'
-                else:
-                    env_value = 'FALSE'
-            elif self.env_type == str:
-                self.resolved_value = env_value
-            elif self.env_type == int:
-                self.resolved_value = int(env_value)
-            elif self.env_type == float:
-                self.resolved_value = float(env_value)
-            elif self.env_type == Decimal:
-                self.resolved_value = Decimal(env_value)
-            else:
-                self.issues.append(EnvIssue(
-                    env=self.name,
-                    description=f"Unsupported type: {self.env_type}"
-                ))
-                return
-        except ValueError:
+            self.resolved_value = coerce(env_value)
+        except (ValueError, ArithmeticError):
             self.issues.append(EnvIssue(
                 env=self.name,
                 description="Type validation failed."
             ))
             return
 
-        os.environ[self.name] = env_value
+        if self.env_type is bool:
+            env_value = 'TRUE' if self.resolved_value else 'FALSE'
+
+        # Writing to os.environ goes through putenv, so only do it when the value actually changed.
+        if env_value != env_value_raw:
+            os.environ[self.name] = env_value
+
+        self.raw_value = env_value
+        self.valid = True
+
 
-        if self.prod_critical is True and self.raw_value != self.prod_value:
-            logger.warning(f'Production critical env {self.name} is not set to the expected value.')
\ No newline at end of file
+class ConfiguredEnv(TypedDict):
+    """
+    Represents a configured environment variable.
+
+    :param name: The name of the environment variable.
+    :param description: A description of the environment variable's purpose.
+    :param env_type: The expected type of the environment variable (e.g., str, bool, int, float, Decimal).
+    :param default: The default value for the environment variable if not set. Environment variables without a default value are required. Defaults to None.
+    :param secure: Whether the environment variable contains sensitive information. Defaults to True.
+    :param prod_critical: Indicates if the environment variable is critical in production. If set to True, the environment variable will be validated to have the correct type and value in production. Defaults to False.
+    :param prod_value: The expected value of the environment variable in production. Defaults to None.
+    :param value: The current value of the environment variable.
+    :param raw: The raw environment variable string.
+    """
+    name: str
+    description: str
+    env_type: str
+    default: str | None
+    secure: bool
+    prod_critical: bool
+    prod_value: _ResolvedType
+    value: _ResolvedType
+    raw: str
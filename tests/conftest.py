@@ -0,0 +1,38 @@
+import os
+import pytest
+import config_manager.env_manager as env_manager
+from config_manager.env_configs import env_configs
+from config_manager.types import EnvConfig
+
+
+def _reset_state():
+    env_configs.clear()
+    env_manager.resolved_envs.clear()
+    env_manager.prod_validation.clear()
+    env_manager.validated = False
+
+@pytest.fixture
+def reset_state(monkeypatch):
+    """Give each test an empty environment and clean module state"""
+    # Rebinding os.environ to a plain dict avoids a putenv/unsetenv call per variable. Only Python-level reads see it;
+    # C-level getenv() still reads the real process environment.
+    monkeypatch.setattr(os, 'environ', {})
+    _reset_state()
+    
+    yield
+    
+    _reset_state()
+
+@pytest.fixture
+def reset_validation():
+    """Return a callable that resets the validation state so validate_env can run again within a test"""
+    def _reset():
+        env_manager.validated = False
+        env_manager.resolved_envs.clear()
+    
+    return _reset
+
+@pytest.fixture(scope="session")
+def basic_str_config():
+    """A shared string EnvConfig for tests that only read it"""
+    return EnvConfig(name="TEST_ENV", description="Test", env_type=str, register=False)
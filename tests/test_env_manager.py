@@ -1,4 +1,4 @@
-import os
+import typing
 import pytest
 from decimal import Decimal
 from config_manager.types import EnvConfig, EnvIssue
@@ -6,6 +6,7 @@ from config_manager.exceptions import (
     AlreadyConfiguredException,
     ConfigurationValidationFailedException,
     ConfigurationNotFoundException,
+    IncorrectConfigTypeException,
     PrematureConfigurationRetrievalException
 )
 from config_manager.env_manager import (
@@ -16,208 +17,193 @@ from config_manager.env_manager import (
     get_config_int,
     get_config_float,
     get_config_decimal,
-    get_configuration
+    get_configuration,
+    bind_config,
+    bind_config_str,
+    bind_config_bool,
+    bind_config_int,
+    bind_config_float,
+    bind_config_decimal
 )
 
-@pytest.fixture(autouse=True)
-def clean_env():
-    """Clean up environment variables before and after each test"""
-    # Store original environment
-    original_env = dict(os.environ)
-    
-    # Clear all environment variables
-    os.environ.clear()
-    
-    # Reset module state
-    from config_manager.env_configs import env_configs
-    import config_manager.env_manager as env_manager
-    
-    env_configs.clear()
-    env_manager.resolved_envs.clear()
-    env_manager.prod_validation.clear()
-    env_manager.validated = False
-    
-    yield
-    
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
-    
-    # Reset module state again after test
-    env_configs.clear()
-    env_manager.resolved_envs.clear()
-    env_manager.prod_validation.clear()
-    env_manager.validated = False
+pytestmark = pytest.mark.usefixtures("reset_state")
 
-def test_string_env():
-    """Test string environment variable configuration and retrieval"""
+@pytest.mark.parametrize(
+    "name,env_type,getter,default,expected_default,expected_raw_default,raw,expected,expected_raw",
+    [
+        ("TEST_STRING", str, get_config_str, "default_value", "default_value", "default_value", "custom_value", "custom_value", "custom_value"),
+        ("TEST_BOOL", bool, get_config_bool, "true", True, "TRUE", "false", False, "FALSE"),
+        ("TEST_INT", int, get_config_int, "42", 42, "42", "123", 123, "123"),
+        ("TEST_FLOAT", float, get_config_float, "3.14", 3.14, "3.14", "2.718", 2.718, "2.718"),
+        ("TEST_DECIMAL", Decimal, get_config_decimal, "1.23456789", Decimal("1.23456789"), "1.23456789", "9.87654321", Decimal("9.87654321"), "9.87654321"),
+    ],
+    ids=["string", "boolean", "integer", "float", "decimal"]
+)
+def test_typed_env(monkeypatch, reset_validation, name, env_type, getter, default, expected_default, expected_raw_default, raw, expected, expected_raw):
+    """Test typed environment variable configuration and retrieval"""
     EnvConfig(
-        name="TEST_STRING",
-        description="A test string environment variable",
-        env_type=str,
-        default="default_value"
+        name=name,
+        description=f"A test {env_type.__name__} environment variable",
+        env_type=env_type,
+        default=default
     )
     
     # Test with default value
     validate_env()
-    assert get_config("TEST_STRING") == "default_value"
-    assert get_config_str("TEST_STRING") == "default_value"
+    assert get_config(name) == expected_raw_default
+    assert getter(name) == expected_default
+    assert type(getter(name)) is env_type
     
     # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
+    reset_validation()
     
     # Test with set value
-    os.environ["TEST_STRING"] = "custom_value"
+    monkeypatch.setenv(name, raw)
     validate_env()
-    assert get_config("TEST_STRING") == "custom_value"
-    assert get_config_str("TEST_STRING") == "custom_value"
+    assert get_config(name) == expected_raw
+    assert getter(name) == expected
+    assert type(getter(name)) is env_type
 
-def test_boolean_env():
-    """Test boolean environment variable configuration and retrieval"""
+def test_required_env(monkeypatch, reset_validation):
+    """Test required environment variable validation"""
     EnvConfig(
-        name="TEST_BOOL",
-        description="A test boolean environment variable",
-        env_type=bool,
-        default="true"
+        name="REQUIRED_ENV",
+        description="A required environment variable",
+        env_type=str
     )
     
-    # Test with default value
-    validate_env()
-    assert get_config("TEST_BOOL") == "TRUE"
-    assert get_config_bool("TEST_BOOL") is True
+    # Should raise exception when required env is not set
+    with pytest.raises(ConfigurationValidationFailedException, match=r"REQUIRED_ENV: Required env has not been set"):
+        validate_env(max_issues=1)
     
     # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
+    reset_validation()
     
-    # Test with false value
-    os.environ["TEST_BOOL"] = "false"
+    # Should pass when required env is set
+    monkeypatch.setenv("REQUIRED_ENV", "value")
     validate_env()
-    assert get_config("TEST_BOOL") == "FALSE"
-    assert get_config_bool("TEST_BOOL") is False
+    assert get_config("REQUIRED_ENV") == "value"
 
-def test_integer_env():
-    """Test integer environment variable configuration and retrieval"""
+def test_invalid_type_conversion(monkeypatch):
+    """Test invalid type conversion handling"""
     EnvConfig(
         name="TEST_INT",
         description="A test integer environment variable",
-        env_type=int,
-        default="42"
+        env_type=int
     )
     
-    # Test with default value
-    validate_env()
-    assert get_config("TEST_INT") == "42"
-    assert get_config_int("TEST_INT") == 42
-    
-    # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
+    monkeypatch.setenv("TEST_INT", "not_an_integer")
     
-    # Test with custom value
-    os.environ["TEST_INT"] = "123"
-    validate_env()
-    assert get_config("TEST_INT") == "123"
-    assert get_config_int("TEST_INT") == 123
+    with pytest.raises(ConfigurationValidationFailedException, match=r"TEST_INT: Type validation failed"):
+        validate_env(max_issues=1)
 
-def test_float_env():
-    """Test float environment variable configuration and retrieval"""
+def test_max_issues():
+    """Test that validation stops once max_issues issues have been collected"""
     EnvConfig(
-        name="TEST_FLOAT",
-        description="A test float environment variable",
-        env_type=float,
-        default="3.14"
+        name="REQUIRED_ENV1",
+        description="First required environment variable",
+        env_type=str
     )
-    
-    # Test with default value
-    validate_env()
-    assert get_config("TEST_FLOAT") == "3.14"
-    assert get_config_float("TEST_FLOAT") == 3.14
-    
-    # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
-    
-    # Test with custom value
-    os.environ["TEST_FLOAT"] = "2.718"
-    validate_env()
-    assert get_config("TEST_FLOAT") == "2.718"
-    assert get_config_float("TEST_FLOAT") == 2.718
-
-def test_decimal_env():
-    """Test decimal environment variable configuration and retrieval"""
     EnvConfig(
-        name="TEST_DECIMAL",
-        description="A test decimal environment variable",
-        env_type=Decimal,
-        default="1.23456789"
+        name="REQUIRED_ENV2",
+        description="Second required environment variable",
+        env_type=str
     )
     
-    # Test with default value
-    validate_env()
-    assert get_config("TEST_DECIMAL") == "1.23456789"
-    assert get_config_decimal("TEST_DECIMAL") == Decimal("1.23456789")
+    with pytest.raises(ConfigurationValidationFailedException) as exc_info:
+        validate_env(max_issues=1)
     
-    # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
+    assert [issue.env for issue in exc_info.value.issues] == ["REQUIRED_ENV1"]
     
-    # Test with custom value
-    os.environ["TEST_DECIMAL"] = "9.87654321"
-    validate_env()
-    assert get_config("TEST_DECIMAL") == "9.87654321"
-    assert get_config_decimal("TEST_DECIMAL") == Decimal("9.87654321")
+    with pytest.raises(ConfigurationValidationFailedException) as exc_info:
+        validate_env()
+    
+    assert [issue.env for issue in exc_info.value.issues] == ["REQUIRED_ENV1", "REQUIRED_ENV2"]
 
-def test_required_env():
-    """Test required environment variable validation"""
+@pytest.mark.parametrize("max_issues", [0, -1])
+def test_max_issues_below_one(max_issues):
+    """Test that a max_issues below 1 is rejected rather than masking issues"""
     EnvConfig(
         name="REQUIRED_ENV",
         description="A required environment variable",
         env_type=str
     )
     
-    # Should raise exception when required env is not set
-    with pytest.raises(ConfigurationValidationFailedException) as exc_info:
-        validate_env()
+    with pytest.raises(ValueError):
+        validate_env(max_issues=max_issues)
     
-    assert any(
-        issue.env == "REQUIRED_ENV" and "Required env has not been set" in issue.description
-        for issue in exc_info.value.issues
+    with pytest.raises(PrematureConfigurationRetrievalException):
+        get_config("REQUIRED_ENV")
+
+def test_invalid_env_type():
+    """Test that unsupported env types fail validation"""
+    EnvConfig(
+        name="TEST_LIST",
+        description="An environment variable with an unsupported type",
+        env_type=list,
+        default="a,b"
     )
     
-    # Reset validation state for next test
-    import config_manager.env_manager as env_manager
-    env_manager.validated = False
-    env_manager.resolved_envs.clear()
+    with pytest.raises(ConfigurationValidationFailedException, match=r"TEST_LIST: Invalid 'env_type' configuration"):
+        validate_env()
+
+def test_env_type_changed_before_validation():
+    """Test that an env_type change made before validation is used for coercion"""
+    config = EnvConfig(
+        name="TEST_NUMBER",
+        description="A test numeric environment variable",
+        env_type=int,
+        default="2"
+    )
+    config.env_type = float
     
-    # Should pass when required env is set
-    os.environ["REQUIRED_ENV"] = "value"
     validate_env()
-    assert get_config("REQUIRED_ENV") == "value"
+    
+    assert type(get_config_float("TEST_NUMBER")) is float
+    assert get_configuration()[0]["env_type"] == "float"
 
-def test_invalid_type_conversion():
-    """Test invalid type conversion handling"""
+def test_invalid_decimal_value(monkeypatch):
+    """Test that malformed decimal strings fail validation"""
     EnvConfig(
-        name="TEST_INT",
-        description="A test integer environment variable",
-        env_type=int
+        name="TEST_DECIMAL",
+        description="A test decimal environment variable",
+        env_type=Decimal
     )
     
-    os.environ["TEST_INT"] = "not_an_integer"
+    monkeypatch.setenv("TEST_DECIMAL", "not_a_decimal")
     
-    with pytest.raises(ConfigurationValidationFailedException) as exc_info:
+    with pytest.raises(ConfigurationValidationFailedException, match=r"TEST_DECIMAL: Type validation failed"):
         validate_env()
+
+@pytest.mark.parametrize(
+    "raw,expected,expected_raw",
+    [("on", True, "TRUE"), (" Yes ", True, "TRUE"), ("tRuE", True, "TRUE"), ("0", False, "FALSE"), ("OFF", False, "FALSE"), ("No\n", False, "FALSE")]
+)
+def test_boolean_spellings(monkeypatch, raw, expected, expected_raw):
+    """Test accepted boolean spellings and their canonical raw form"""
+    EnvConfig(
+        name="TEST_BOOL",
+        description="A test boolean environment variable",
+        env_type=bool
+    )
     
-    assert any(
-        issue.env == "TEST_INT" and "Type validation failed" in issue.description
-        for issue in exc_info.value.issues
+    monkeypatch.setenv("TEST_BOOL", raw)
+    validate_env()
+    assert get_config_bool("TEST_BOOL") is expected
+    assert get_config("TEST_BOOL") == expected_raw
+
+def test_invalid_boolean_value(monkeypatch):
+    """Test that unrecognised boolean strings fail validation"""
+    EnvConfig(
+        name="TEST_BOOL",
+        description="A test boolean environment variable",
+        env_type=bool
     )
+    
+    monkeypatch.setenv("TEST_BOOL", "maybe")
+    
+    with pytest.raises(ConfigurationValidationFailedException, match=r"TEST_BOOL: Type validation failed"):
+        validate_env()
 
 def test_premature_config_retrieval():
     """Test premature configuration retrieval handling"""
@@ -238,6 +224,63 @@ def test_nonexistent_config():
     with pytest.raises(ConfigurationNotFoundException):
         get_config("NONEXISTENT_ENV")
 
+def test_bind_config():
+    """Test binding config values to accessors"""
+    EnvConfig(
+        name="TEST_INT",
+        description="A test integer environment variable",
+        env_type=int,
+        default="42"
+    )
+    
+    with pytest.raises(PrematureConfigurationRetrievalException):
+        bind_config_int("TEST_INT")
+    
+    validate_env()
+    get_port = bind_config_int("TEST_INT")
+    get_port_raw = bind_config("TEST_INT")
+    
+    assert get_port() == 42
+    assert get_port_raw() == "42"
+    
+    with pytest.raises(IncorrectConfigTypeException):
+        bind_config_str("TEST_INT")
+
+@pytest.mark.parametrize(
+    "env_type,binder,default,expected",
+    [
+        (str, bind_config_str, "value", "value"),
+        (bool, bind_config_bool, "false", False),
+        (int, bind_config_int, "42", 42),
+        (float, bind_config_float, "3.14", 3.14),
+        (Decimal, bind_config_decimal, "1.23", Decimal("1.23")),
+    ],
+    ids=["string", "boolean", "integer", "float", "decimal"]
+)
+def test_bind_config_typed(env_type, binder, default, expected):
+    """Test typed bind accessors return the checked value and reject other types"""
+    EnvConfig(
+        name="TEST_ENV",
+        description="A test environment variable",
+        env_type=env_type,
+        default=default
+    )
+    EnvConfig(
+        name="OTHER_ENV",
+        description="An environment variable of a different type",
+        env_type=int if env_type is str else str,
+        default="1"
+    )
+    
+    validate_env()
+    accessor = binder("TEST_ENV")
+    
+    assert accessor() == expected
+    assert type(accessor()) is env_type
+    
+    with pytest.raises(IncorrectConfigTypeException):
+        binder("OTHER_ENV")
+
 def test_double_validation():
     """Test double validation prevention"""
     EnvConfig(
@@ -252,18 +295,30 @@ def test_double_validation():
     with pytest.raises(AlreadyConfiguredException):
         validate_env()
 
-def test_production_critical_env():
+@pytest.mark.parametrize("env_type,prod_value,env_value,warns", [
+    (str, "expected_value", "different_value", True),
+    (str, "expected_value", "expected_value", False),
+    (bool, "true", "true", False),
+    (bool, "true", "0", True),
+    (int, "10", "010", False),
+    (int, "10", "11", True),
+])
+def test_production_critical_env(monkeypatch, caplog, env_type, prod_value, env_value, warns):
     """Test production critical environment variable validation"""
     EnvConfig(
         name="PROD_ENV",
         description="A production critical environment variable",
-        env_type=str,
+        env_type=env_type,
         prod_critical=True,
-        prod_value="expected_value"
+        prod_value=prod_value
     )
     
-    os.environ["PROD_ENV"] = "different_value"
-    validate_env()  # Should log a warning about mismatched prod value
+    monkeypatch.setenv("PROD_ENV", env_value)
+    with caplog.at_level("WARNING", logger="config_manager.env_manager"):
+        validate_env()
+    
+    warned = "Production critical env PROD_ENV is not set to the expected value." in caplog.messages
+    assert warned is warns
 
 def test_get_configuration():
     """Test getting all configurations"""
@@ -271,13 +326,15 @@ def test_get_configuration():
         name="TEST_ENV1",
         description="First test environment variable",
         env_type=str,
-        default="value1"
+        default="value1",
+        secure=False
     )
     EnvConfig(
         name="TEST_ENV2",
         description="Second test environment variable",
         env_type=int,
-        default="42"
+        default="42",
+        secure=False
     )
     
     validate_env()
@@ -285,7 +342,9 @@ def test_get_configuration():
     
     assert len(configs) == 2
     assert any(c["name"] == "TEST_ENV1" and c["value"] == "value1" for c in configs)
-    assert any(c["name"] == "TEST_ENV2" and c["value"] == "42" for c in configs)
+    assert any(c["name"] == "TEST_ENV2" and c["value"] == 42 for c in configs)
+    assert any(c["name"] == "TEST_ENV2" and c["env_type"] == "int" for c in configs)
+    assert get_configuration() is configs
 
 def test_secure_env_masking():
     """Test secure environment variable masking"""
@@ -302,3 +361,8 @@ def test_secure_env_masking():
     
     secure_config = next(c for c in configs if c["name"] == "SECURE_ENV")
     assert secure_config["value"] == "***"  # Value should be masked
+
+@pytest.mark.parametrize("func", [get_config_decimal, bind_config_int, validate_env, get_configuration])
+def test_type_hints_resolve(func):
+    """Test that getter annotations resolve at runtime"""
+    assert typing.get_type_hints(func)
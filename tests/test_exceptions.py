@@ -0,0 +1,25 @@
+import pickle
+from config_manager.exceptions import ConfigurationValidationFailedException
+from config_manager.issues import EnvIssue
+
+def test_validation_failed_exception_pickle():
+    """Test ConfigurationValidationFailedException survives a pickle round trip"""
+    exc = ConfigurationValidationFailedException([EnvIssue(env="TEST_ENV", description="Test issue description")])
+    
+    restored = pickle.loads(pickle.dumps(exc))
+    
+    assert restored.issues == exc.issues
+    assert str(restored) == str(exc)
+    assert "TEST_ENV" in repr(exc)
+
+def test_validation_failed_exception_message_cached():
+    """Test the validation failure message is rendered once and reused"""
+    exc = ConfigurationValidationFailedException([
+        EnvIssue(env="TEST_ENV1", description="First issue"),
+        EnvIssue(env="TEST_ENV2", description="Second issue")
+    ])
+    
+    message = str(exc)
+    
+    assert message.endswith("TEST_ENV1: First issue\nTEST_ENV2: Second issue")
+    assert str(exc) is message
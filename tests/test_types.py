@@ -1,6 +1,10 @@
+import dataclasses
+import os
+import typing
 import pytest
 from decimal import Decimal
-from config_manager.types import EnvConfig, EnvIssue, ResolvedEnv, ConfiguredEnv
+from config_manager.env_configs import env_configs
+from config_manager.types import EnvConfig, EnvIssue, ResolvedEnv, ResolvedType, ConfiguredEnv
 
 def test_env_config_creation():
     """Test EnvConfig creation and validation"""
@@ -11,7 +15,8 @@ def test_env_config_creation():
         default="default_value",
         secure=True,
         prod_critical=False,
-        prod_value=None
+        prod_value=None,
+        register=False
     )
     
     assert config.name == "TEST_ENV"
@@ -21,6 +26,8 @@ def test_env_config_creation():
     assert config.secure is True
     assert config.prod_critical is False
     assert config.prod_value is None
+    assert config not in env_configs
+    assert [f.name for f in dataclasses.fields(config) if f.name.startswith("_")] == []
 
 def test_env_issue_str_representation():
     """Test EnvIssue string representation"""
@@ -31,13 +38,9 @@ def test_env_issue_str_representation():
     
     assert str(issue) == "TEST_ENV: Test issue description"
 
-def test_resolved_env_creation():
+def test_resolved_env_creation(basic_str_config):
     """Test ResolvedEnv creation and validation"""
-    config = EnvConfig(
-        name="TEST_ENV",
-        description="A test environment variable",
-        env_type=str
-    )
+    config = basic_str_config
     
     resolved = ResolvedEnv(
         config=config,
@@ -48,6 +51,14 @@ def test_resolved_env_creation():
     assert resolved.config == config
     assert resolved.value == "test_value"
     assert resolved.raw == "test_value"
+    
+    same = ResolvedEnv(config=config, value="test_value", raw="test_value")
+    assert resolved == same
+    assert hash(resolved) == hash(same)
+    assert resolved != ResolvedEnv(config=config, value="other_value", raw="other_value")
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        resolved.value = "other_value"
 
 def test_configured_env_dict():
     """Test ConfiguredEnv TypedDict usage"""
@@ -73,40 +84,38 @@ def test_configured_env_dict():
     assert config_dict["value"] == "current_value"
     assert config_dict["raw"] == "current_value"
 
-def test_env_config_type_validation():
+@pytest.mark.parametrize(
+    "env_type,raw,expected",
+    [(str, "value", "value"), (bool, "true", True), (int, "42", 42), (float, "3.14", 3.14), (Decimal, "1.23", Decimal("1.23"))],
+    ids=["string", "boolean", "integer", "float", "decimal"]
+)
+def test_env_config_type_validation(monkeypatch, env_type, raw, expected):
     """Test EnvConfig type validation"""
-    # Test valid types
-    EnvConfig(name="TEST_STR", description="Test", env_type=str)
-    EnvConfig(name="TEST_BOOL", description="Test", env_type=bool)
-    EnvConfig(name="TEST_INT", description="Test", env_type=int)
-    EnvConfig(name="TEST_FLOAT", description="Test", env_type=float)
-    EnvConfig(name="TEST_DECIMAL", description="Test", env_type=Decimal)
-
-def test_resolved_env_value_types():
-    """Test ResolvedEnv value type validation"""
-    config = EnvConfig(name="TEST_ENV", description="Test", env_type=str)
-    
-    # Test string value
-    resolved = ResolvedEnv(config=config, value="test", raw="test")
-    assert resolved.value == "test"
-    assert resolved.raw == "test"
-    
-    # Test boolean value
-    resolved = ResolvedEnv(config=config, value=True, raw="true")
-    assert resolved.value is True
-    assert resolved.raw == "true"
-    
-    # Test integer value
-    resolved = ResolvedEnv(config=config, value=42, raw="42")
-    assert resolved.value == 42
-    assert resolved.raw == "42"
+    # Validation writes canonical values back to os.environ, so keep it away from the real environment.
+    monkeypatch.setattr(os, 'environ', {})
+    config = EnvConfig(name="TEST_ENV", description="Test", env_type=env_type, default=raw, register=False)
     
-    # Test float value
-    resolved = ResolvedEnv(config=config, value=3.14, raw="3.14")
-    assert resolved.value == 3.14
-    assert resolved.raw == "3.14"
+    config._validate({})
     
-    # Test decimal value
-    resolved = ResolvedEnv(config=config, value=Decimal("1.23"), raw="1.23")
-    assert resolved.value == Decimal("1.23")
-    assert resolved.raw == "1.23"
+    assert config.issues == []
+    assert config.valid is True
+    assert config.resolved_value == expected
+    assert type(config.resolved_value) is env_type
+
+@pytest.mark.parametrize(
+    "value,raw",
+    [("test", "test"), (True, "true"), (42, "42"), (3.14, "3.14"), (Decimal("1.23"), "1.23")],
+    ids=["string", "boolean", "integer", "float", "decimal"]
+)
+def test_resolved_env_value_types(basic_str_config, value, raw):
+    """Test ResolvedEnv value type validation"""
+    resolved = ResolvedEnv(config=basic_str_config, value=value, raw=raw)
+    assert resolved.value == value
+    assert type(resolved.value) is type(value)
+    assert resolved.raw == raw
+    assert isinstance(resolved.value, ResolvedType)
+
+@pytest.mark.parametrize("obj", [EnvConfig, ResolvedEnv, ConfiguredEnv, EnvIssue])
+def test_type_hints_resolve(obj):
+    """Test that public type annotations resolve at runtime"""
+    assert typing.get_type_hints(obj)